@@ -272,6 +272,17 @@ def read_scenario_combinations(sh):
     return result
 
 
+def _annual_rows(df_result):
+    """Header row plus one row per metric: INTEGER_ROWS as ints, everything else rounded to 2 dp."""
+    rows = [["Metric"] + list(df_result.columns)]
+    for row_name, vals in zip(df_result.index, df_result.to_numpy().tolist()):
+        if row_name in INTEGER_ROWS:
+            rows.append([row_name] + [int(v) for v in vals])
+        else:
+            rows.append([row_name] + [round(v, 2) for v in vals])
+    return rows
+
+
 def write_output(sh, results):
     """Write all scenario results to the Output tab."""
     ws = _ws(sh, TAB_OUTPUT)
@@ -280,13 +291,7 @@ def write_output(sh, results):
     all_rows = []
     for (label, df_result, investment, total_return, roi, moic, payback_year) in results:
         all_rows.append([f"=== {label} ==="])
-        all_rows.append(["Metric"] + list(df_result.columns))
-        for row_name in df_result.index:
-            row_vals = [row_name]
-            for col in df_result.columns:
-                val = df_result.loc[row_name, col]
-                row_vals.append(int(val) if row_name in INTEGER_ROWS else round(float(val), 2))
-            all_rows.append(row_vals)
+        all_rows.extend(_annual_rows(df_result))
         all_rows.append([])
         all_rows.append([])
 
@@ -337,13 +342,7 @@ def write_pl_output(sh, results):
     all_rows = []
     for (label, pl_df_result, investment, total_return, roi, moic, payback_year) in results:
         all_rows.append([f"=== {label} ==="])
-        all_rows.append(["Metric"] + list(pl_df_result.columns))
-        for row_name in pl_df_result.index:
-            row_vals = [row_name]
-            for col in pl_df_result.columns:
-                val = pl_df_result.loc[row_name, col]
-                row_vals.append(int(val) if row_name in INTEGER_ROWS else round(float(val), 2))
-            all_rows.append(row_vals)
+        all_rows.extend(_annual_rows(pl_df_result))
         all_rows.append([])
         all_rows.append([])
 